@@ -23,8 +23,30 @@ CHAIRMAN_MODEL = "claude-opus-4-5"
 # Research model - web-search-capable model for Stage 0 pre-research
 RESEARCH_MODEL = "perplexity/sonar"
 
+# Stage 1 straggler handling: after this many seconds, models that haven't
+# answered are dropped (as long as at least one model has answered)
+STAGE1_SOFT_DEADLINE = 90.0
+
+# Stage 2 straggler handling: once this fraction of the council has returned a
+# ranking and the soft deadline (seconds) has passed, Stage 3 starts without
+# waiting for the rest
+STAGE2_QUORUM_FRACTION = 0.75
+STAGE2_SOFT_DEADLINE = 60.0
+
 # API endpoint (Straico OpenAI-compatible)
 OPENROUTER_API_URL = "https://api.straico.com/v0/chat/completions"
 
 # Data directory for conversation storage
 DATA_DIR = "data/conversations"
+
+# SQLite database for response caches (kept outside DATA_DIR, which only holds conversations)
+CACHE_DB_PATH = "data/cache.db"
+
+# Generated conversation titles, keyed on a hash of the first message
+TITLE_CACHE_PATH = "data/title_cache.json"
+
+# Cache for full council runs: entry lifetime in seconds
+SEMANTIC_CACHE_TTL = 24 * 60 * 60
+
+# Stage 0 research cache: lifetime in seconds of a cached sub-query result
+RESEARCH_CACHE_TTL = 6 * 60 * 60
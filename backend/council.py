@@ -1,24 +1,65 @@
 """3-stage LLM Council orchestration."""
 
 import asyncio
-import json
+import atexit
+import hashlib
+import io
+import math
+import os
+import random
 import re
-from typing import List, Dict, Any, Tuple, AsyncGenerator
-from .openrouter import query_models_parallel, query_model
-from .config import COUNCIL_MODELS, CHAIRMAN_MODEL, RESEARCH_MODEL
-
-
-async def _decompose_query(user_query: str) -> Dict[str, Any]:
-    """
-    Use Sonar to decompose a user query into 2-3 focused sub-queries.
-
-    Returns:
-        Dict with 'needs_research' (bool) and 'sub_queries' (list of strings)
-    """
-    decompose_prompt = f"""You are a research planning assistant. Given a user question, determine if it references specific products, tools, platforms, companies, frameworks, or niche topics that would benefit from web research.
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple, AsyncGenerator, Awaitable, Callable
+from . import research_cache, semantic_cache
+from .json_compat import loads as _loads, dumps as _dumps
+from .ranking import parse_ranking_from_text, calculate_aggregate_rankings
+from .openrouter import (
+    PermanentQueryError,
+    query_models_as_completed,
+    query_models_quorum,
+    query_model,
+)
+from .config import (
+    COUNCIL_MODELS,
+    CHAIRMAN_MODEL,
+    RESEARCH_MODEL,
+    STAGE1_SOFT_DEADLINE,
+    STAGE2_QUORUM_FRACTION,
+    STAGE2_SOFT_DEADLINE,
+    TITLE_CACHE_PATH,
+)
+
+# Local "no research needed" heuristics for Stage 0. Deliberately narrow: a
+# query only skips Sonar when it is small talk, numbers joined by arithmetic
+# operators, or a question naming nothing but a well-known general topic.
+_SMALL_TALK_RE = re.compile(
+    r"^(hi|hello|hey|yo|thanks|thank you|ok|okay|good (morning|afternoon|evening))"
+    r"( there| all| everyone)?[\s!.?]*$",
+    re.IGNORECASE
+)
+_ARITHMETIC_RE = re.compile(
+    r"^(what is |what's |calculate |compute )?"
+    r"[\s(]*-?\d[\d.,]*[\s)]*"
+    r"([+\-*/×÷^%][\s(]*-?\d[\d.,]*[\s)]*)+=?\s*\??$",
+    re.IGNORECASE
+)
+_GENERAL_TOPIC_RE = re.compile(
+    r"^(what|how|why) (is|are|do|does) (a |an |the )?"
+    r"(python|excel|sql|javascript|html|css|git|linux|recursion|"
+    r"loops?|apis?|inflation|compound interest|photosynthesis|gravity)"
+    r"( work| mean)?[\s?.!]*$",
+    re.IGNORECASE
+)
+
+
+# Static instruction prefixes. These are sent as system messages marked with
+# cache_control so providers that support prompt caching can reuse the prefix;
+# providers that don't simply ignore the extra field.
+DECOMPOSE_SYSTEM = """You are a research planning assistant. Given a user question, determine if it references specific products, tools, platforms, companies, frameworks, or niche topics that would benefit from web research.
 
 If the question only involves well-known, general knowledge topics (e.g., Python, Excel, basic business concepts), respond with:
-{{"needs_research": false}}
+{"needs_research": false}
 
 If research would help, break the question into 2-3 focused web search sub-queries, each targeting a DIFFERENT aspect:
 - Sub-query 1: What the product/tool/platform IS (factual overview)
@@ -31,12 +72,201 @@ Rules:
 - Each should target a genuinely different angle
 
 Respond in JSON format ONLY, no other text:
-{{"needs_research": true, "sub_queries": ["query1", "query2", "query3"]}}
+{"needs_research": true, "sub_queries": ["query1", "query2", "query3"]}"""
+
+RESEARCH_SYSTEM = """You are a web research assistant. Search the web and provide thorough, practical information about the research topic given by the user.
+
+Provide comprehensive findings including:
+- What it is (official description, key features, purpose)
+- Practical use cases and real-world examples
+- Getting started guides, tutorials, or community resources
+- Pricing, licensing, or availability info if applicable
+- Notable alternatives or competitors
+- Any relevant regional context (especially Singapore/Asia if applicable)
+
+Be factual and cite specific details. If you cannot find information, say so clearly rather than guessing."""
+
+RANKING_SYSTEM = """You are evaluating different responses to a question. The question and the responses from different models (anonymized) follow these instructions.
+
+Your task:
+1. First, evaluate each response individually. For each response, explain what it does well and what it does poorly.
+2. Then, at the very end of your response, provide a final ranking.
+
+IMPORTANT: Your final ranking MUST be formatted EXACTLY as follows:
+- Start with the line "FINAL RANKING:" (all caps, with colon)
+- Then list the responses from best to worst as a numbered list
+- Each line should be: number, period, space, then ONLY the response label (e.g., "1. Response A")
+- Do not add any other text or explanations in the ranking section
+
+Example of the correct format for your ENTIRE response:
+
+Response A provides good detail on X but misses Y...
+Response B is accurate but lacks depth on Z...
+Response C offers the most comprehensive answer...
+
+FINAL RANKING:
+1. Response C
+2. Response A
+3. Response B"""
+
+CHAIRMAN_SYSTEM = """You are the Chairman of an LLM Council. Multiple AI models have provided responses to a user's question, and then ranked each other's responses.
+
+Your task as Chairman is to synthesize all of this information into a single, comprehensive, accurate answer to the user's original question. Consider:
+- The individual responses and their insights
+- The peer rankings and what they reveal about response quality
+- Any patterns of agreement or disagreement
+
+Provide a clear, well-reasoned final answer that represents the council's collective wisdom."""
+
+# Stage 3 fallback response when the chairman call fails
+SYNTHESIS_ERROR = "Error: Unable to generate final synthesis."
+
+TITLE_SYSTEM = """Generate a very short title (3-5 words maximum) that summarizes the question given by the user.
+The title should be concise and descriptive. Do not use quotes or punctuation in the title. Respond with the title only."""
+
 
-User question: {user_query}"""
+def _cached_system_message(*texts: str) -> Dict[str, Any]:
+    """Build a system message whose text blocks are each marked as a cacheable prefix."""
+    return {
+        "role": "system",
+        "content": [
+            {"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}
+            for text in texts
+        ]
+    }
+
+
+async def _with_retry(
+    coro_factory: Callable[[float], Awaitable[Optional[Dict[str, Any]]]],
+    attempts: int = 3,
+    base: float = 0.3,
+    deadline: float = 25.0
+) -> Optional[Dict[str, Any]]:
+    """
+    Retry a model query with jittered exponential backoff inside a wall-clock budget.
+
+    A None result (query_model's transient-failure signal: timeout, connection
+    error, 429 or 5xx) or a timeout triggers a retry after base * 2**i seconds
+    plus up to 0.3s of jitter. No attempt or backoff runs past the deadline, so
+    the stage's worst-case latency stays bounded. Callers pass
+    raise_permanent=True to query_model, so a PermanentQueryError (bad key,
+    bad request, unknown model) is not retried and propagates immediately.
+
+    Args:
+        coro_factory: Called with the remaining budget in seconds; returns the query coroutine
+        attempts: Maximum number of attempts
+        base: Base backoff delay in seconds
+        deadline: Total wall-clock budget in seconds across all attempts
+
+    Returns:
+        The first successful response, or None if every attempt failed
+
+    Raises:
+        PermanentQueryError: The query failed in a way a retry cannot fix
+    """
+    loop = asyncio.get_running_loop()
+    stop_at = loop.time() + deadline
+
+    for attempt in range(attempts):
+        remaining = stop_at - loop.time()
+        if remaining <= 0:
+            break
 
-    messages = [{"role": "user", "content": decompose_prompt}]
-    response = await query_model(RESEARCH_MODEL, messages, timeout=20.0)
+        try:
+            response = await asyncio.wait_for(coro_factory(remaining), timeout=remaining)
+        except asyncio.TimeoutError:
+            response = None
+
+        if response is not None:
+            return response
+
+        if attempt < attempts - 1:
+            delay = base * 2 ** attempt + random.random() * 0.3
+            if loop.time() + delay >= stop_at:
+                break
+            await asyncio.sleep(delay)
+
+    return None
+
+
+def _extract_json_object(text: str) -> Optional[str]:
+    """
+    Extract the first balanced {...} object from text.
+
+    Scans for matching braces while tracking string literals (with backslash
+    escapes), so nested objects and braces inside strings are handled.
+
+    Returns:
+        The JSON object substring, or None if no balanced object is found
+    """
+    start = text.find('{')
+    if start == -1:
+        return None
+
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        char = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+
+    return None
+
+
+def _trivially_general(query: str) -> bool:
+    """
+    Cheap local check for queries that obviously need no web research.
+
+    Only returns True when confident; anything uncertain (including short
+    queries naming a product, e.g. "What is Streamlit?") goes to Sonar.
+    """
+    query = query.strip()
+    if _SMALL_TALK_RE.match(query) or _ARITHMETIC_RE.match(query):
+        return True
+    return _GENERAL_TOPIC_RE.match(query) is not None
+
+
+async def _decompose_query(user_query: str) -> Dict[str, Any]:
+    """
+    Use Sonar to decompose a user query into 2-3 focused sub-queries.
+
+    Obviously general queries are answered locally without a Sonar call.
+
+    Returns:
+        Dict with 'needs_research' (bool) and 'sub_queries' (list of strings)
+    """
+    if _trivially_general(user_query):
+        return {"needs_research": False, "sub_queries": []}
+
+    messages = [
+        _cached_system_message(DECOMPOSE_SYSTEM),
+        {"role": "user", "content": f"User question: {user_query}"},
+    ]
+    try:
+        response = await _with_retry(
+            lambda remaining: query_model(
+                RESEARCH_MODEL, messages, timeout=min(remaining, 20.0), raise_permanent=True
+            ),
+            deadline=25.0
+        )
+    except PermanentQueryError as e:
+        # Research would hit the same model and key, so answer without it
+        print(f"Skipping research: {e}")
+        return {"needs_research": False, "sub_queries": []}
 
     if response is None:
         return {"needs_research": True, "sub_queries": [user_query]}
@@ -46,15 +276,15 @@ User question: {user_query}"""
     # Try to parse JSON from the response
     try:
         # Find JSON in the response (may be wrapped in markdown code blocks)
-        json_match = re.search(r'\{[^}]+\}', content, re.DOTALL)
-        if json_match:
-            parsed = json.loads(json_match.group())
+        json_text = _extract_json_object(content)
+        if json_text:
+            parsed = _loads(json_text)
             if not parsed.get('needs_research', True):
                 return {"needs_research": False, "sub_queries": []}
             sub_queries = parsed.get('sub_queries', [user_query])
             # Cap at 3 sub-queries
             return {"needs_research": True, "sub_queries": sub_queries[:3]}
-    except (json.JSONDecodeError, AttributeError):
+    except (ValueError, AttributeError):
         pass
 
     # Fallback: if parsing fails, just research the original query
@@ -65,34 +295,89 @@ async def _research_sub_query(sub_query: str, label: str) -> Dict[str, Any]:
     """
     Research a single sub-query with an enhanced, deep prompt.
 
+    Results are cached by sub-query text for RESEARCH_CACHE_TTL, so recurring
+    topics are served without a Sonar call.
+
     Returns:
         Dict with 'label', 'query', 'response' (or None on failure)
+
+    Raises:
+        PermanentQueryError: Sonar rejected the request in a way a retry cannot fix
     """
-    research_prompt = f"""You are a web research assistant. Search the web and provide thorough, practical information about the following topic.
+    cached_response = await asyncio.to_thread(research_cache.get, sub_query)
+    if cached_response is not None:
+        return {"label": label, "query": sub_query, "response": cached_response}
 
-Research topic: {sub_query}
+    messages = [
+        _cached_system_message(RESEARCH_SYSTEM),
+        {"role": "user", "content": f"Research topic: {sub_query}"},
+    ]
+    response = await _with_retry(
+        lambda remaining: query_model(
+            RESEARCH_MODEL, messages, timeout=min(remaining, 30.0), raise_permanent=True
+        ),
+        deadline=40.0
+    )
 
-Provide comprehensive findings including:
-- What it is (official description, key features, purpose)
-- Practical use cases and real-world examples
-- Getting started guides, tutorials, or community resources
-- Pricing, licensing, or availability info if applicable
-- Notable alternatives or competitors
-- Any relevant regional context (especially Singapore/Asia if applicable)
+    if response is None:
+        return {"label": label, "query": sub_query, "response": None}
 
-Be factual and cite specific details. If you cannot find information, say so clearly rather than guessing."""
+    content = response.get('content') or ''
+    if not content.strip():
+        return {"label": label, "query": sub_query, "response": None}
 
-    messages = [{"role": "user", "content": research_prompt}]
-    response = await query_model(RESEARCH_MODEL, messages, timeout=30.0)
+    await asyncio.to_thread(research_cache.put, sub_query, content)
+    return {"label": label, "query": sub_query, "response": content}
 
-    if response is None:
-        return {"label": label, "query": sub_query, "response": None}
 
-    content = response.get('content', '')
-    return {"label": label, "query": sub_query, "response": content if content.strip() else None}
+async def _research_sub_queries(
+    sub_queries: List[str]
+) -> AsyncGenerator[Tuple[int, Dict[str, Any]], None]:
+    """
+    Research sub-queries concurrently, yielding (index, result) as each finishes.
 
+    Only results with a non-empty response are yielded; a failed sub-query is
+    dropped and the others continue. A PermanentQueryError (bad key, unknown
+    model) would hit every sibling the same way, so it cancels the remaining
+    research and ends the generator early, keeping whatever already arrived.
+    """
+    tasks = {
+        asyncio.create_task(_research_sub_query(sq, f"Research {i+1}")): i
+        for i, sq in enumerate(sub_queries)
+    }
+    pending = set(tasks)
 
-async def stage0_research(user_query: str) -> Dict[str, Any]:
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+            # Retrieve every result or exception in the batch so none is left
+            # unobserved, then stop if any failure was permanent
+            stop = False
+            for task in done:
+                try:
+                    result = task.result()
+                except PermanentQueryError as e:
+                    print(f"Stopping research early: {e}")
+                    stop = True
+                    continue
+                except Exception as e:
+                    print(f"Error researching sub-query: {e}")
+                    continue
+                if result.get('response'):
+                    yield tasks[task], result
+
+            if stop:
+                return
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def stage0_research(
+    user_query: str,
+    decomposition: Dict[str, Any] = None
+) -> Dict[str, Any]:
     """
     Enhanced Stage 0: Decompose → Parallel Research → Synthesize.
 
@@ -100,11 +385,16 @@ async def stage0_research(user_query: str) -> Dict[str, Any]:
     2. Researches each sub-query in parallel using Sonar
     3. Concatenates results with clear section headers
 
+    Args:
+        user_query: The user's question
+        decomposition: Result of _decompose_query, if the caller already has it
+
     Returns:
         Dict with 'model', 'response', 'has_research', 'sub_queries', 'sub_results'
     """
     # Phase A: Decompose query
-    decomposition = await _decompose_query(user_query)
+    if decomposition is None:
+        decomposition = await _decompose_query(user_query)
 
     if not decomposition.get('needs_research', True):
         return {
@@ -117,20 +407,10 @@ async def stage0_research(user_query: str) -> Dict[str, Any]:
 
     sub_queries = decomposition['sub_queries']
 
-    # Phase B: Parallel research on all sub-queries
-    tasks = [
-        _research_sub_query(sq, f"Research {i+1}")
-        for i, sq in enumerate(sub_queries)
-    ]
-    raw_results = await asyncio.gather(*tasks, return_exceptions=True)
-
-    # Filter out failures
-    sub_results = []
-    for result in raw_results:
-        if isinstance(result, Exception) or result is None:
-            continue
-        if isinstance(result, dict) and result.get('response'):
-            sub_results.append(result)
+    # Phase B: Parallel research on all sub-queries (failures are skipped)
+    indexed_results = [item async for item in _research_sub_queries(sub_queries)]
+    indexed_results.sort(key=lambda item: item[0])
+    sub_results = [result for _, result in indexed_results]
 
     if not sub_results:
         return {
@@ -184,19 +464,16 @@ async def stage0_research_stream(user_query: str) -> AsyncGenerator[Tuple[str, D
 
     # Phase B: Parallel research
     yield ('stage0_researching', {"sub_queries": sub_queries})
-    tasks = [
-        _research_sub_query(sq, f"Research {i+1}")
-        for i, sq in enumerate(sub_queries)
-    ]
-    raw_results = await asyncio.gather(*tasks, return_exceptions=True)
 
-    sub_results = []
-    for i, result in enumerate(raw_results):
-        if isinstance(result, Exception) or result is None:
-            continue
-        if isinstance(result, dict) and result.get('response'):
-            sub_results.append(result)
-            yield ('stage0_sub_result', {"index": i, "result": result})
+    # Emit each sub-result as soon as it arrives rather than after the slowest
+    indexed_results = []
+    async for i, result in _research_sub_queries(sub_queries):
+        indexed_results.append((i, result))
+        yield ('stage0_sub_result', {"index": i, "result": result})
+
+    # Merge in sub-query order, not arrival order
+    indexed_results.sort(key=lambda item: item[0])
+    sub_results = [result for _, result in indexed_results]
 
     if not sub_results:
         result = {
@@ -247,18 +524,21 @@ async def stage1_collect_responses(user_query: str, research_context: str = None
         })
     messages.append({"role": "user", "content": user_query})
 
-    # Query all models in parallel
-    responses = await query_models_parallel(COUNCIL_MODELS, messages)
-
-    # Format results
+    # Query all models in parallel, collecting responses as they arrive and
+    # dropping stragglers after the soft deadline
     stage1_results = []
-    for model, response in responses.items():
+    async for model, response in query_models_as_completed(
+        COUNCIL_MODELS, messages, STAGE1_SOFT_DEADLINE
+    ):
         if response is not None:  # Only include successful responses
             stage1_results.append({
                 "model": model,
                 "response": response.get('content', '')
             })
 
+    # Keep council order stable regardless of arrival order
+    stage1_results.sort(key=lambda r: COUNCIL_MODELS.index(r['model']))
+
     return stage1_results
 
 
@@ -285,47 +565,34 @@ async def stage2_collect_rankings(
         for label, result in zip(labels, stage1_results)
     }
 
-    # Build the ranking prompt
-    responses_text = "\n\n".join([
-        f"Response {label}:\n{result['response']}"
-        for label, result in zip(labels, stage1_results)
-    ])
-
-    ranking_prompt = f"""You are evaluating different responses to the following question:
-
-Question: {user_query}
-
-Here are the responses from different models (anonymized):
-
-{responses_text}
-
-Your task:
-1. First, evaluate each response individually. For each response, explain what it does well and what it does poorly.
-2. Then, at the very end of your response, provide a final ranking.
-
-IMPORTANT: Your final ranking MUST be formatted EXACTLY as follows:
-- Start with the line "FINAL RANKING:" (all caps, with colon)
-- Then list the responses from best to worst as a numbered list
-- Each line should be: number, period, space, then ONLY the response label (e.g., "1. Response A")
-- Do not add any other text or explanations in the ranking section
-
-Example of the correct format for your ENTIRE response:
-
-Response A provides good detail on X but misses Y...
-Response B is accurate but lacks depth on Z...
-Response C offers the most comprehensive answer...
-
-FINAL RANKING:
-1. Response C
-2. Response A
-3. Response B
-
-Now provide your evaluation and ranking:"""
-
-    messages = [{"role": "user", "content": ranking_prompt}]
+    # Build the question + anonymized responses block in a single buffer. It is
+    # byte-identical for every council model, so it goes in the cached system
+    # prefix and the parallel ranking calls can hit the provider prompt cache.
+    buf = io.StringIO()
+    buf.write("Question: ")
+    buf.write(user_query)
+    buf.write("\n\nHere are the responses from different models (anonymized):\n\n")
+    for i, (label, result) in enumerate(zip(labels, stage1_results)):
+        if i:
+            buf.write("\n\n")
+        buf.write("Response ")
+        buf.write(label)
+        buf.write(":\n")
+        buf.write(result['response'] or '')
+    responses_text = buf.getvalue()
+
+    messages = [
+        _cached_system_message(RANKING_SYSTEM, responses_text),
+        {"role": "user", "content": "Now provide your evaluation and ranking:"},
+    ]
 
-    # Get rankings from all council models in parallel
-    responses = await query_models_parallel(COUNCIL_MODELS, messages)
+    # Get rankings from all council models in parallel. Once a quorum has
+    # ranked and the soft deadline has passed, stragglers are dropped so
+    # Stage 3 isn't held up by one slow model.
+    quorum = math.ceil(STAGE2_QUORUM_FRACTION * len(COUNCIL_MODELS))
+    responses = await query_models_quorum(
+        COUNCIL_MODELS, messages, quorum, STAGE2_SOFT_DEADLINE
+    )
 
     # Format results
     stage2_results = []
@@ -358,44 +625,50 @@ async def stage3_synthesize_final(
     Returns:
         Dict with 'model' and 'response' keys
     """
-    # Build comprehensive context for chairman
-    stage1_text = "\n\n".join([
-        f"Model: {result['model']}\nResponse: {result['response']}"
-        for result in stage1_results
-    ])
-
-    stage2_text = "\n\n".join([
-        f"Model: {result['model']}\nRanking: {result['ranking']}"
-        for result in stage2_results
-    ])
-
-    chairman_prompt = f"""You are the Chairman of an LLM Council. Multiple AI models have provided responses to a user's question, and then ranked each other's responses.
-
-Original Question: {user_query}
-
-STAGE 1 - Individual Responses:
-{stage1_text}
-
-STAGE 2 - Peer Rankings:
-{stage2_text}
-
-Your task as Chairman is to synthesize all of this information into a single, comprehensive, accurate answer to the user's original question. Consider:
-- The individual responses and their insights
-- The peer rankings and what they reveal about response quality
-- Any patterns of agreement or disagreement
-
-Provide a clear, well-reasoned final answer that represents the council's collective wisdom:"""
-
-    messages = [{"role": "user", "content": chairman_prompt}]
+    # Build comprehensive context for chairman in a single buffer
+    buf = io.StringIO()
+    buf.write("Original Question: ")
+    buf.write(user_query)
+    buf.write("\n\nSTAGE 1 - Individual Responses:\n")
+    for i, result in enumerate(stage1_results):
+        if i:
+            buf.write("\n\n")
+        buf.write("Model: ")
+        buf.write(result['model'])
+        buf.write("\nResponse: ")
+        buf.write(result['response'] or '')
+    buf.write("\n\nSTAGE 2 - Peer Rankings:\n")
+    for i, result in enumerate(stage2_results):
+        if i:
+            buf.write("\n\n")
+        buf.write("Model: ")
+        buf.write(result['model'])
+        buf.write("\nRanking: ")
+        buf.write(result['ranking'] or '')
+    buf.write("\n\nProvide your final answer:")
+    chairman_prompt = buf.getvalue()
+
+    messages = [
+        _cached_system_message(CHAIRMAN_SYSTEM),
+        {"role": "user", "content": chairman_prompt},
+    ]
 
     # Query the chairman model
-    response = await query_model(CHAIRMAN_MODEL, messages)
+    try:
+        response = await _with_retry(
+            lambda remaining: query_model(
+                CHAIRMAN_MODEL, messages, timeout=min(remaining, 120.0), raise_permanent=True
+            ),
+            deadline=150.0
+        )
+    except PermanentQueryError:
+        response = None
 
     if response is None:
         # Fallback if chairman fails
         return {
             "model": CHAIRMAN_MODEL,
-            "response": "Error: Unable to generate final synthesis."
+            "response": SYNTHESIS_ERROR
         }
 
     return {
@@ -404,105 +677,75 @@ Provide a clear, well-reasoned final answer that represents the council's collec
     }
 
 
-def parse_ranking_from_text(ranking_text: str) -> List[str]:
-    """
-    Parse the FINAL RANKING section from the model's response.
+def _load_title_cache() -> "OrderedDict[str, str]":
+    """Load persisted conversation titles, or start empty if none are saved."""
+    if not os.path.exists(TITLE_CACHE_PATH):
+        return OrderedDict()
+    try:
+        with open(TITLE_CACHE_PATH, 'r', encoding='utf-8') as f:
+            titles = OrderedDict(_loads(f.read()))
+    except (OSError, ValueError, TypeError):
+        return OrderedDict()
 
-    Args:
-        ranking_text: The full text response from the model
+    # Keep only the most recent entries if the file predates the size cap
+    while len(titles) > _TITLE_CACHE_MAX_SIZE:
+        titles.popitem(last=False)
+    return titles
 
-    Returns:
-        List of response labels in ranked order
-    """
-    import re
-
-    # Look for "FINAL RANKING:" section
-    if "FINAL RANKING:" in ranking_text:
-        # Extract everything after "FINAL RANKING:"
-        parts = ranking_text.split("FINAL RANKING:")
-        if len(parts) >= 2:
-            ranking_section = parts[1]
-            # Try to extract numbered list format (e.g., "1. Response A")
-            # This pattern looks for: number, period, optional space, "Response X"
-            numbered_matches = re.findall(r'\d+\.\s*Response [A-Z]', ranking_section)
-            if numbered_matches:
-                # Extract just the "Response X" part
-                return [re.search(r'Response [A-Z]', m).group() for m in numbered_matches]
-
-            # Fallback: Extract all "Response X" patterns in order
-            matches = re.findall(r'Response [A-Z]', ranking_section)
-            return matches
-
-    # Fallback: try to find any "Response X" patterns in order
-    matches = re.findall(r'Response [A-Z]', ranking_text)
-    return matches
-
-
-def calculate_aggregate_rankings(
-    stage2_results: List[Dict[str, Any]],
-    label_to_model: Dict[str, str]
-) -> List[Dict[str, Any]]:
-    """
-    Calculate aggregate rankings across all models.
 
-    Args:
-        stage2_results: Rankings from each model
-        label_to_model: Mapping from anonymous labels to model names
-
-    Returns:
-        List of dicts with model name and average rank, sorted best to worst
+def _save_title_cache():
     """
-    from collections import defaultdict
-
-    # Track positions for each model
-    model_positions = defaultdict(list)
-
-    for ranking in stage2_results:
-        ranking_text = ranking['ranking']
-
-        # Parse the ranking from the structured format
-        parsed_ranking = parse_ranking_from_text(ranking_text)
-
-        for position, label in enumerate(parsed_ranking, start=1):
-            if label in label_to_model:
-                model_name = label_to_model[label]
-                model_positions[model_name].append(position)
+    Persist conversation titles so they survive restarts.
 
-    # Calculate average position for each model
-    aggregate = []
-    for model, positions in model_positions.items():
-        if positions:
-            avg_rank = sum(positions) / len(positions)
-            aggregate.append({
-                "model": model,
-                "average_rank": round(avg_rank, 2),
-                "rankings_count": len(positions)
-            })
+    Written to a per-process temp file and swapped in with os.replace, so a
+    reader never sees a partial file. With several worker processes each
+    saves its own cache and the last one to exit wins; losing the others'
+    titles only costs a model call later.
+    """
+    if not _TITLE_CACHE:
+        return
+    tmp_path = f"{TITLE_CACHE_PATH}.{os.getpid()}.tmp"
+    try:
+        Path(TITLE_CACHE_PATH).parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(_dumps(_TITLE_CACHE))
+        os.replace(tmp_path, TITLE_CACHE_PATH)
+    except OSError as e:
+        print(f"Failed to save title cache: {e}")
 
-    # Sort by average rank (lower is better)
-    aggregate.sort(key=lambda x: x['average_rank'])
 
-    return aggregate
+# LRU of titles keyed on blake2b(user_query), oldest first. No lock is needed:
+# each dict operation completes without yielding to the event loop. Identical
+# first messages arriving concurrently may both miss and both call the model;
+# that duplicate call is accepted.
+_TITLE_CACHE_MAX_SIZE = 1024
+_TITLE_CACHE: "OrderedDict[str, str]" = _load_title_cache()
+atexit.register(_save_title_cache)
 
 
 async def generate_conversation_title(user_query: str) -> str:
     """
     Generate a short title for a conversation based on the first user message.
 
+    Titles generated from real model output are memoized (LRU, 1024 entries)
+    on a hash of the message, so repeated first messages skip the model call.
+
     Args:
         user_query: The first user message
 
     Returns:
         A short title (3-5 words)
     """
-    title_prompt = f"""Generate a very short title (3-5 words maximum) that summarizes the following question.
-The title should be concise and descriptive. Do not use quotes or punctuation in the title.
-
-Question: {user_query}
-
-Title:"""
-
-    messages = [{"role": "user", "content": title_prompt}]
+    cache_key = hashlib.blake2b(user_query.encode()).hexdigest()
+    cached_title = _TITLE_CACHE.get(cache_key)
+    if cached_title is not None:
+        _TITLE_CACHE.move_to_end(cache_key)
+        return cached_title
+
+    messages = [
+        _cached_system_message(TITLE_SYSTEM),
+        {"role": "user", "content": f"Question: {user_query}\n\nTitle:"},
+    ]
 
     # Use research model for title generation (Sonar is fast and cheap)
     response = await query_model(RESEARCH_MODEL, messages, timeout=30.0)
@@ -511,15 +754,19 @@ Title:"""
         # Fallback to a generic title
         return "New Conversation"
 
-    title = response.get('content', 'New Conversation').strip()
-
     # Clean up the title - remove quotes, limit length
-    title = title.strip('"\'')
+    title = (response.get('content') or '').strip().strip('"\'')
+    if not title:
+        # Empty model output: use the generic title, but don't cache it
+        return "New Conversation"
 
     # Truncate if too long
     if len(title) > 50:
         title = title[:47] + "..."
 
+    _TITLE_CACHE[cache_key] = title
+    if len(_TITLE_CACHE) > _TITLE_CACHE_MAX_SIZE:
+        _TITLE_CACHE.popitem(last=False)
     return title
 
 
@@ -527,22 +774,42 @@ async def run_full_council(user_query: str) -> Tuple[Dict, List, List, Dict, Dic
     """
     Run the complete council process (Stage 0 research + 3 deliberation stages).
 
+    Queries matching a successful run within the cache TTL (after
+    normalization) are served from the cache without any model calls.
+
     Args:
         user_query: The user's question
 
     Returns:
         Tuple of (stage0_result, stage1_results, stage2_results, stage3_result, metadata)
     """
-    # Stage 0: Pre-research with web-search model
-    stage0_result = await stage0_research(user_query)
+    cached = await asyncio.to_thread(semantic_cache.lookup, user_query)
+    if cached is not None:
+        return cached
+
+    # Stage 0 + Stage 1: start the council speculatively on the bare query while
+    # Sonar decides whether research is needed. The speculative answers are used
+    # when no research context comes back, and cancelled as soon as one does.
+    speculative_stage1 = asyncio.create_task(stage1_collect_responses(user_query))
+    try:
+        decomposition = await _decompose_query(user_query)
+        stage0_result = await stage0_research(user_query, decomposition)
+    except BaseException:
+        # Stage 0 failed or the request was cancelled: don't leave the
+        # council calls running unattended
+        speculative_stage1.cancel()
+        raise
     research_context = stage0_result.get('response')
 
-    # Stage 1: Collect individual responses (with research context if available)
-    stage1_results = await stage1_collect_responses(user_query, research_context)
+    if research_context:
+        speculative_stage1.cancel()
+        stage1_results = await stage1_collect_responses(user_query, research_context)
+    else:
+        stage1_results = await speculative_stage1
 
     # If no models responded successfully, return error
     if not stage1_results:
-        return [], [], {
+        return stage0_result, [], [], {
             "model": "error",
             "response": "All models failed to respond. Please try again."
         }, {}
@@ -566,4 +833,10 @@ async def run_full_council(user_query: str) -> Tuple[Dict, List, List, Dict, Dic
         "aggregate_rankings": aggregate_rankings
     }
 
-    return stage0_result, stage1_results, stage2_results, stage3_result, metadata
+    result = (stage0_result, stage1_results, stage2_results, stage3_result, metadata)
+
+    # Only cache complete runs, never a failed synthesis or a run with no rankings
+    if stage2_results and stage3_result['response'] != SYNTHESIS_ERROR:
+        await asyncio.to_thread(semantic_cache.store, user_query, result)
+
+    return result
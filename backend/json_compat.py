@@ -0,0 +1,19 @@
+"""JSON helpers that use orjson when it is installed, falling back to the stdlib."""
+
+import json
+
+try:
+    import orjson
+
+    loads = orjson.loads
+
+    def dumps(obj) -> str:
+        """Serialize obj to a JSON string."""
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+    loads = json.loads
+
+    def dumps(obj) -> str:
+        """Serialize obj to a JSON string, matching orjson's compact UTF-8 output."""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
@@ -1,14 +1,62 @@
 """OpenRouter API client for making LLM requests."""
 
 import httpx
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AsyncGenerator, Tuple
+from .json_compat import dumps
 from .config import OPENROUTER_API_KEY, OPENROUTER_API_URL
 
+# 4xx statuses that a later attempt can still succeed on; every other 4xx
+# (bad key, bad request, unknown model) fails the same way on retry
+_RETRYABLE_4XX = frozenset({408, 429})
+
+
+class PermanentQueryError(Exception):
+    """A model query failed in a way that retrying cannot fix."""
+
+
+# Shared client so every stage reuses pooled keep-alive connections instead
+# of paying a new TCP + TLS handshake per model call
+_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it on first use."""
+    global _CLIENT
+    if _CLIENT is None or _CLIENT.is_closed:
+        _CLIENT = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+            timeout=60.0
+        )
+    return _CLIENT
+
+
+async def close_client():
+    """Close the shared HTTP client (called on application shutdown)."""
+    global _CLIENT
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+        _CLIENT = None
+
+
+def encode_messages(messages: List[Dict[str, Any]]) -> bytes:
+    """
+    Serialize messages to JSON once so they can be shared by several requests.
+
+    Args:
+        messages: List of message dicts with 'role' and 'content'
+
+    Returns:
+        UTF-8 encoded JSON array
+    """
+    return dumps(messages).encode()
+
 
 async def query_model(
     model: str,
     messages: List[Dict[str, str]],
-    timeout: float = 120.0
+    timeout: float = 120.0,
+    messages_json: Optional[bytes] = None,
+    raise_permanent: bool = False
 ) -> Optional[Dict[str, Any]]:
     """
     Query a single model via OpenRouter API.
@@ -17,6 +65,11 @@ async def query_model(
         model: OpenRouter model identifier (e.g., "openai/gpt-4o")
         messages: List of message dicts with 'role' and 'content'
         timeout: Request timeout in seconds
+        messages_json: Pre-serialized messages from encode_messages(); when given,
+            only the model field is serialized per request
+        raise_permanent: Raise PermanentQueryError instead of returning None for
+            failures a retry cannot fix (4xx other than 408/429, malformed
+            responses); timeouts, connection errors, 429 and 5xx still return None
 
     Returns:
         Response dict with 'content' and optional 'reasoning_details', or None if failed
@@ -26,30 +79,45 @@ async def query_model(
         "Content-Type": "application/json",
     }
 
-    payload = {
-        "model": model,
-        "messages": messages,
-    }
+    if messages_json is None:
+        messages_json = encode_messages(messages)
+
+    # Splice the shared messages bytes into the body instead of re-serializing
+    # the whole payload for every model
+    body = b'{"model":' + dumps(model).encode() + b',"messages":' + messages_json + b'}'
 
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.post(
-                OPENROUTER_API_URL,
-                headers=headers,
-                json=payload
-            )
-            response.raise_for_status()
+        response = await get_client().post(
+            OPENROUTER_API_URL,
+            headers=headers,
+            content=body,
+            timeout=timeout
+        )
+        response.raise_for_status()
 
-            data = response.json()
-            message = data['choices'][0]['message']
+        data = response.json()
+        message = data['choices'][0]['message']
 
-            return {
-                'content': message.get('content'),
-                'reasoning_details': message.get('reasoning_details')
-            }
+        return {
+            'content': message.get('content'),
+            'reasoning_details': message.get('reasoning_details')
+        }
+
+    except httpx.HTTPStatusError as e:
+        print(f"Error querying model {model}: {e}")
+        status = e.response.status_code
+        if raise_permanent and status < 500 and status not in _RETRYABLE_4XX:
+            raise PermanentQueryError(f"{model} returned HTTP {status}") from e
+        return None
+
+    except httpx.TransportError as e:
+        print(f"Error querying model {model}: {e}")
+        return None
 
     except Exception as e:
         print(f"Error querying model {model}: {e}")
+        if raise_permanent:
+            raise PermanentQueryError(f"{model} returned an unusable response") from e
         return None
 
 
@@ -69,11 +137,121 @@ async def query_models_parallel(
     """
     import asyncio
 
-    # Create tasks for all models
-    tasks = [query_model(model, messages) for model in models]
+    # Create tasks for all models, sharing one serialized copy of the messages
+    messages_json = encode_messages(messages)
+    tasks = [query_model(model, messages, messages_json=messages_json) for model in models]
 
     # Wait for all to complete
     responses = await asyncio.gather(*tasks)
 
     # Map models to their responses
     return {model: response for model, response in zip(models, responses)}
+
+
+async def query_models_quorum(
+    models: List[str],
+    messages: List[Dict[str, str]],
+    quorum: int,
+    soft_deadline: float
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    Query multiple models in parallel, dropping stragglers once a quorum has answered.
+
+    Every model is waited on until soft_deadline has passed. After that, the
+    call returns as soon as at least `quorum` models have responded
+    successfully, and the remaining requests are cancelled.
+
+    Args:
+        models: List of OpenRouter model identifiers
+        messages: List of message dicts to send to each model
+        quorum: Number of successful responses needed before stragglers may be dropped
+        soft_deadline: Seconds to wait for all models before settling for a quorum
+
+    Returns:
+        Dict mapping model identifier to response dict (or None if failed or dropped)
+    """
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + soft_deadline
+
+    messages_json = encode_messages(messages)
+    tasks = {
+        asyncio.create_task(query_model(model, messages, messages_json=messages_json)): model
+        for model in models
+    }
+    responses = {}
+    pending = set(tasks)
+
+    while pending:
+        remaining = deadline - loop.time()
+        successes = sum(1 for response in responses.values() if response is not None)
+        if remaining <= 0 and successes >= quorum:
+            break
+
+        done, pending = await asyncio.wait(
+            pending,
+            timeout=remaining if remaining > 0 else None,
+            return_when=asyncio.FIRST_COMPLETED
+        )
+        for task in done:
+            responses[tasks[task]] = task.result()
+
+    # Drop stragglers
+    for task in pending:
+        task.cancel()
+
+    return {model: responses.get(model) for model in models}
+
+
+async def query_models_as_completed(
+    models: List[str],
+    messages: List[Dict[str, str]],
+    soft_deadline: float
+) -> AsyncGenerator[Tuple[str, Optional[Dict[str, Any]]], None]:
+    """
+    Query multiple models in parallel, yielding each response as it arrives.
+
+    Once soft_deadline has passed and at least one model has responded
+    successfully, the remaining requests are cancelled and the generator stops.
+
+    Args:
+        models: List of OpenRouter model identifiers
+        messages: List of message dicts to send to each model
+        soft_deadline: Seconds after which slow models may be dropped
+
+    Yields:
+        (model, response) tuples in completion order (response is None if failed)
+    """
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + soft_deadline
+
+    messages_json = encode_messages(messages)
+    tasks = {
+        asyncio.create_task(query_model(model, messages, messages_json=messages_json)): model
+        for model in models
+    }
+    pending = set(tasks)
+    answered = False
+
+    try:
+        while pending:
+            remaining = deadline - loop.time()
+            if remaining <= 0 and answered:
+                break
+
+            done, pending = await asyncio.wait(
+                pending,
+                timeout=remaining if remaining > 0 else None,
+                return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                response = task.result()
+                answered = answered or response is not None
+                yield tasks[task], response
+    finally:
+        # Drop stragglers, including when the caller stops iterating early
+        for task in pending:
+            task.cancel()
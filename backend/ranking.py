@@ -0,0 +1,147 @@
+"""
+Ranking parsing and aggregation for Stage 2.
+
+This module is pure, fully annotated and free of I/O so it can be compiled
+ahead of time with mypyc (`mypyc backend/ranking.py`) for bulk re-scoring of
+conversation histories or evaluation runs, without any API change.
+"""
+
+import re
+from typing import Any, Dict, List
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore[assignment]
+
+# Ranking parse patterns, compiled once at import
+_NUMBERED_RANK_RE = re.compile(r'\d+\.\s*(Response [A-Z])')
+_RESPONSE_LABEL_RE = re.compile(r'Response [A-Z]')
+
+
+def parse_ranking_from_text(ranking_text: str) -> List[str]:
+    """
+    Parse the FINAL RANKING section from the model's response.
+
+    Args:
+        ranking_text: The full text response from the model
+
+    Returns:
+        List of response labels in ranked order
+    """
+    # Look for "FINAL RANKING:" section
+    _, found, ranking_section = ranking_text.partition("FINAL RANKING:")
+    if found:
+        # Try to extract numbered list format (e.g., "1. Response A")
+        # The capture group yields just the "Response X" part
+        numbered_matches = _NUMBERED_RANK_RE.findall(ranking_section)
+        if numbered_matches:
+            return numbered_matches
+
+        # Fallback: Extract all "Response X" patterns in order
+        matches = _RESPONSE_LABEL_RE.findall(ranking_section)
+        return matches
+
+    # Fallback: try to find any "Response X" patterns in order
+    matches = _RESPONSE_LABEL_RE.findall(ranking_text)
+    return matches
+
+
+# Below this many rankers, NumPy call overhead outweighs the vectorized sums
+_NUMPY_MIN_RANKERS = 6
+
+
+def _aggregate_rankings_numpy(
+    stage2_results: List[Dict[str, Any]],
+    label_to_model: Dict[str, str]
+) -> List[Dict[str, Any]]:
+    """
+    NumPy version of calculate_aggregate_rankings for larger councils.
+
+    Position sums and counts per label are computed with np.bincount. Output
+    (including tie order, by first appearance) matches the pure-Python path.
+    """
+    labels = list(label_to_model)
+    column = {label: j for j, label in enumerate(labels)}
+
+    columns: List[int] = []
+    positions: List[int] = []
+    for ranking in stage2_results:
+        for position, label in enumerate(ranking['parsed_ranking'], start=1):
+            j = column.get(label)
+            if j is not None:
+                columns.append(j)
+                positions.append(position)
+
+    if not columns:
+        return []
+
+    column_array = np.asarray(columns)
+    sums = np.bincount(column_array, weights=np.asarray(positions, dtype=float), minlength=len(labels))
+    counts = np.bincount(column_array, minlength=len(labels))
+
+    # Ranked labels in order of first appearance
+    ranked, first_seen = np.unique(column_array, return_index=True)
+    order = ranked[np.argsort(first_seen)]
+    averages = sums[order] / counts[order]
+
+    aggregate = [
+        {
+            "model": label_to_model[labels[j]],
+            "average_rank": round(float(average), 2),
+            "rankings_count": int(counts[j])
+        }
+        for j, average in zip(order, averages)
+    ]
+    aggregate.sort(key=lambda x: x['average_rank'])
+
+    return aggregate
+
+
+def calculate_aggregate_rankings(
+    stage2_results: List[Dict[str, Any]],
+    label_to_model: Dict[str, str]
+) -> List[Dict[str, Any]]:
+    """
+    Calculate aggregate rankings across all models.
+
+    Args:
+        stage2_results: Rankings from each model
+        label_to_model: Mapping from anonymous labels to model names
+
+    Returns:
+        List of dicts with model name and average rank, sorted best to worst
+    """
+    if np is not None and len(stage2_results) >= _NUMPY_MIN_RANKERS:
+        return _aggregate_rankings_numpy(stage2_results, label_to_model)
+
+    # Running [sum of positions, count] per model. Stage 2 already parsed
+    # each ranking, so the stored parsed_ranking is used directly.
+    totals: Dict[str, List[int]] = {}
+
+    for ranking in stage2_results:
+        for position, label in enumerate(ranking['parsed_ranking'], start=1):
+            model_name = label_to_model.get(label)
+            if model_name is None:
+                continue
+            entry = totals.get(model_name)
+            if entry is None:
+                totals[model_name] = [position, 1]
+            else:
+                entry[0] += position
+                entry[1] += 1
+
+    # Calculate average position for each model
+    aggregate = [
+        {
+            "model": model,
+            "average_rank": round(position_sum / count, 2),
+            "rankings_count": count
+        }
+        for model, (position_sum, count) in totals.items()
+    ]
+
+    # Sort by average rank (lower is better)
+    aggregate.sort(key=lambda x: x['average_rank'])
+
+    return aggregate
@@ -0,0 +1,66 @@
+"""Exact-match cache of Stage 0 sub-query research, shared across conversations."""
+
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Optional
+from .config import CACHE_DB_PATH, RESEARCH_CACHE_TTL
+
+
+def _connect() -> sqlite3.Connection:
+    """Open the cache database, creating the table if needed."""
+    Path(CACHE_DB_PATH).parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(CACHE_DB_PATH)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS research_cache ("
+        "query TEXT PRIMARY KEY, response TEXT, ts REAL)"
+    )
+    return conn
+
+
+def get(query: str) -> Optional[str]:
+    """
+    Look up cached research for a sub-query.
+
+    Blocking; call from async code via asyncio.to_thread. Database and
+    filesystem errors are treated as a miss.
+
+    Args:
+        query: The sub-query text
+
+    Returns:
+        The cached research text, or None if missing or older than the TTL
+    """
+    try:
+        with closing(_connect()) as conn, conn:
+            row = conn.execute(
+                "SELECT response FROM research_cache WHERE query = ? AND ts > ?",
+                (query, time.time() - RESEARCH_CACHE_TTL)
+            ).fetchone()
+    except (sqlite3.Error, OSError) as e:
+        print(f"Research cache lookup failed: {e}")
+        return None
+
+    return row[0] if row else None
+
+
+def put(query: str, response: str):
+    """
+    Cache research for a sub-query, replacing any previous entry.
+
+    Blocking; call from async code via asyncio.to_thread. Database and
+    filesystem errors are logged and ignored.
+
+    Args:
+        query: The sub-query text
+        response: The research text to store
+    """
+    try:
+        with closing(_connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO research_cache (query, response, ts) VALUES (?, ?, ?)",
+                (query, response, time.time())
+            )
+    except (sqlite3.Error, OSError) as e:
+        print(f"Research cache store failed: {e}")
@@ -0,0 +1,98 @@
+"""Response cache for full council results, keyed on the case-folded query text."""
+
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from .json_compat import loads, dumps
+from .config import CACHE_DB_PATH, SEMANTIC_CACHE_TTL
+
+
+def normalize(query: str) -> str:
+    """
+    Reduce a query to its cache key: case-folded, whitespace collapsed.
+
+    Only trailing sentence punctuation is dropped. Every word and symbol is
+    kept, so "Should I hire you?" and "Should you hire me?", or "C++ vs Java"
+    and "C# vs Java", never share a key.
+
+    Args:
+        query: The user's question
+
+    Returns:
+        Normalized key (empty for a blank query)
+    """
+    return " ".join(query.casefold().split()).rstrip("?.! ")
+
+
+def _connect() -> sqlite3.Connection:
+    """Open the cache database, creating the table if needed."""
+    Path(CACHE_DB_PATH).parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(CACHE_DB_PATH)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS council_cache ("
+        "key TEXT PRIMARY KEY, result TEXT, ts REAL)"
+    )
+    return conn
+
+
+def lookup(query: str) -> Optional[Tuple]:
+    """
+    Find a cached, unexpired council result for the same normalized query.
+
+    Blocking; call from async code via asyncio.to_thread. Database and
+    filesystem errors are treated as a miss.
+
+    Args:
+        query: The user's question
+
+    Returns:
+        The stored (stage0, stage1, stage2, stage3, metadata) tuple, or None on miss
+    """
+    key = normalize(query)
+    if not key:
+        return None
+
+    try:
+        with closing(_connect()) as conn, conn:
+            row = conn.execute(
+                "SELECT result FROM council_cache WHERE key = ? AND ts > ?",
+                (key, time.time() - SEMANTIC_CACHE_TTL)
+            ).fetchone()
+    except (sqlite3.Error, OSError) as e:
+        print(f"Council cache lookup failed: {e}")
+        return None
+
+    if row is None:
+        return None
+    return tuple(loads(row[0]))
+
+
+def store(query: str, result: Tuple[Dict, Any, Any, Dict, Dict]):
+    """
+    Cache a council result under the normalized query, replacing any older entry.
+
+    Blocking; call from async code via asyncio.to_thread. Database and
+    filesystem errors are logged and ignored.
+
+    Args:
+        query: The user's question
+        result: The (stage0, stage1, stage2, stage3, metadata) tuple to store
+    """
+    key = normalize(query)
+    if not key:
+        return
+
+    try:
+        with closing(_connect()) as conn, conn:
+            conn.execute(
+                "DELETE FROM council_cache WHERE ts <= ?",
+                (time.time() - SEMANTIC_CACHE_TTL,)
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO council_cache (key, result, ts) VALUES (?, ?, ?)",
+                (key, dumps(result), time.time())
+            )
+    except (sqlite3.Error, OSError) as e:
+        print(f"Council cache store failed: {e}")